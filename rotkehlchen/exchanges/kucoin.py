@@ -317,7 +317,7 @@ class Kucoin(ExchangeInterface):  # lgtm[py/missing-call-to-init]
                 )
 
             try:
-                response_dict = rlk_jsonloads_dict(response.text)
+                response_dict = rlk_jsonloads_dict(response.content)
             except JSONDecodeError as e:
                 msg = f'Kucoin {case} returned an invalid JSON response: {response.text}.'
                 log.error(msg)
@@ -403,7 +403,10 @@ class Kucoin(ExchangeInterface):  # lgtm[py/missing-call-to-init]
             log.error(msg, response_dict)
             raise RemoteError(msg) from e
 
-        assets_balance: DefaultDict[Asset, Balance] = defaultdict(Balance)
+        # Accounts of the same currency (e.g. main, margin, trade) are summed up
+        # first, so that each currency's asset and USD price are only queried once.
+        # Amounts are summed as FVals and turned into a Balance once per asset
+        currencies_amount: DefaultDict[str, FVal] = defaultdict(FVal)
         for raw_result in accounts_data:
             try:
                 amount = FVal(raw_result['balance'])
@@ -426,13 +429,17 @@ class Kucoin(ExchangeInterface):  # lgtm[py/missing-call-to-init]
                 )
                 continue
 
+            currencies_amount[asset_symbol] += amount
+
+        assets_amount: DefaultDict[Asset, FVal] = defaultdict(FVal)
+        for asset_symbol, amount in currencies_amount.items():
             try:
                 asset = asset_from_kucoin(asset_symbol)
             except DeserializationError as e:
                 log.error(
                     'Unexpected asset symbol in a kucoin balance',
                     error=str(e),
-                    raw_result=raw_result,
+                    asset_symbol=asset_symbol,
                 )
                 self.msg_aggregator.add_error(
                     'Failed to deserialize a kucoin balance. Ignoring it.',
@@ -445,6 +452,11 @@ class Kucoin(ExchangeInterface):  # lgtm[py/missing-call-to-init]
                     f'a balance. Ignoring it.',
                 )
                 continue
+
+            assets_amount[asset] += amount
+
+        assets_balance: Dict[Asset, Balance] = {}
+        for asset, amount in assets_amount.items():
             try:
                 usd_price = Inquirer().find_usd_price(asset=asset)
             except RemoteError:
@@ -454,12 +466,12 @@ class Kucoin(ExchangeInterface):  # lgtm[py/missing-call-to-init]
                 )
                 continue
 
-            assets_balance[asset] += Balance(
+            assets_balance[asset] = Balance(
                 amount=amount,
                 usd_value=amount * usd_price,
             )
 
-        return dict(assets_balance)
+        return assets_balance
 
     @staticmethod
     def _deserialize_asset_movement(
@@ -619,7 +631,7 @@ class Kucoin(ExchangeInterface):  # lgtm[py/missing-call-to-init]
         May raise RemoteError and SystemClockNotSyncedError
         """
         try:
-            response_dict = rlk_jsonloads_dict(response.text)
+            response_dict = rlk_jsonloads_dict(response.content)
         except JSONDecodeError as e:
             msg = f'Kucoin {case} returned an invalid JSON response: {response.text}.'
             log.error(msg)
@@ -638,7 +650,7 @@ class Kucoin(ExchangeInterface):  # lgtm[py/missing-call-to-init]
         if error_code == API_SYSTEM_CLOCK_NOT_SYNCED_ERROR_CODE:
             raise SystemClockNotSyncedError(
                 current_time=str(datetime.now()),
-                remote_server=f'{self.name}',
+                remote_server=self.name,
             )
 
         # Errors related with the API key return a human readable message
@@ -683,7 +695,7 @@ class Kucoin(ExchangeInterface):  # lgtm[py/missing-call-to-init]
             return result, msg
 
         try:
-            response_dict = rlk_jsonloads_dict(accounts_response.text)
+            response_dict = rlk_jsonloads_dict(accounts_response.content)
         except JSONDecodeError as e:
             msg = f'Kucoin balances returned an invalid JSON response: {accounts_response.text}.'
             log.error(msg)
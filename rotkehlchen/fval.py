@@ -23,7 +23,11 @@ class FVal():
     def __init__(self, data: AcceptableFValInitInput = 0):
 
         try:
-            if isinstance(data, float):
+            # Values decoded from JSON are already FVals and get wrapped again
+            # by the deserialization functions, so check for them first
+            if isinstance(data, FVal):
+                self.num = data.num
+            elif isinstance(data, float):
                 self.num = Decimal(str(data))
             elif isinstance(data, bytes):
                 # assume it's an ascii string and try to decode the bytes to one
@@ -34,8 +38,6 @@ class FVal():
                 raise ValueError('Invalid type bool for data given to FVal constructor')
             elif isinstance(data, (Decimal, int, str)):
                 self.num = Decimal(data)
-            elif isinstance(data, FVal):
-                self.num = data.num
             else:
                 raise ValueError(f'Invalid type {type(data)} of data given to FVal constructor')
 
@@ -1,5 +1,6 @@
+import os
+import timeit
 import warnings as test_warnings
-from contextlib import ExitStack
 from http import HTTPStatus
 from json.decoder import JSONDecodeError
 from unittest.mock import patch
@@ -8,12 +9,14 @@ import pytest
 import requests
 
 from rotkehlchen.accounting.structures import Balance
-from rotkehlchen.assets.asset import Asset
 from rotkehlchen.assets.converters import UNSUPPORTED_KUCOIN_ASSETS, asset_from_kucoin
+from rotkehlchen.constants.assets import A_BTC, A_ETH
+from rotkehlchen.constants.timing import DEFAULT_TIMEOUT_TUPLE
 from rotkehlchen.errors import RemoteError, UnknownAsset, UnsupportedAsset
 from rotkehlchen.exchanges.data_structures import AssetMovement, Trade, TradeType
 from rotkehlchen.exchanges.kucoin import Kucoin, KucoinCase, SkipReason
 from rotkehlchen.fval import FVal
+from rotkehlchen.tests.utils.constants import A_BSV, A_KCS, A_USDT
 from rotkehlchen.tests.utils.mock import MockResponse
 from rotkehlchen.typing import (
     AssetAmount,
@@ -26,6 +29,146 @@ from rotkehlchen.typing import (
 )
 from rotkehlchen.utils.serialization import rlk_jsonloads_dict
 
+# Balances of the sandbox account, priced with the mocked current prices
+EXPECTED_SANDBOX_BALANCES = {
+    A_BTC: Balance(
+        amount=FVal('2.61018067'),
+        usd_value=FVal('3.915271005'),
+    ),
+    A_ETH: Balance(
+        amount=FVal('47.43934995'),
+        usd_value=FVal('71.159024925'),
+    ),
+    A_KCS: Balance(
+        amount=FVal('0.2'),
+        usd_value=FVal('0.30'),
+    ),
+    A_USDT: Balance(
+        amount=FVal('45097.26244755'),
+        usd_value=FVal('67645.893671325'),
+    ),
+}
+
+# Time range queried in the sandbox tests. Some of the trades and movements
+# happened exactly at its start and end
+SANDBOX_START_TS = Timestamp(1612556693)
+SANDBOX_END_TS = Timestamp(1612556765)
+
+# Responses of the deposits and withdrawals endpoints, which the sandbox does not support
+DEPOSITS_RESPONSE = (
+    b"""
+    {
+        "code":"200000",
+        "data":{
+            "currentPage":1,
+            "pageSize":500,
+            "totalNum":3,
+            "totalPage":1,
+            "items":[
+                {
+                    "address":"1DrT5xUaJ3CBZPDeFR2qdjppM6dzs4rsMt",
+                    "memo":"",
+                    "currency":"BCHSV",
+                    "amount":1,
+                    "fee":0.1,
+                    "walletTxId":"b893c3ece1b8d7cacb49a39ddd759cf407817f6902f566c443ba16614874ada6",
+                    "isInner":true,
+                    "status":"SUCCESS",
+                    "remark":"movement 4 - deposit",
+                    "createdAt":1612556765000,
+                    "updatedAt":1612556780000
+                },
+                {
+                    "address":"0x5f047b29041bcfdbf0e4478cdfa753a336ba6989",
+                    "memo":"5c247c8a03aa677cea2a251d",
+                    "amount":1,
+                    "fee":0.0001,
+                    "currency":"KCS",
+                    "isInner":false,
+                    "walletTxId":"5bbb57386d99522d9f954c5a",
+                    "status":"SUCCESS",
+                    "remark":"movement 2 - deposit",
+                    "createdAt":1612556693000,
+                    "updatedAt":1612556700000
+                },
+                {
+                    "address":"0x5f047b29041bcfdbf0e4478cdfa753a336ba6989",
+                    "memo":"5c247c8a03aa677cea2a251d",
+                    "amount":1000,
+                    "fee":0.01,
+                    "currency":"LINK",
+                    "isInner":false,
+                    "walletTxId":"5bbb57386d99522d9f954c5b",
+                    "status":"SUCCESS",
+                    "remark":"movement 1 - deposit",
+                    "createdAt":1612556651000,
+                    "updatedAt":1612556658000
+                }
+            ]
+        }
+    }
+    """
+)
+WITHDRAWALS_RESPONSE = (
+    b"""
+    {
+        "code":"200000",
+        "data":{
+            "currentPage":1,
+            "pageSize":500,
+            "totalNum":3,
+            "totalPage":1,
+            "items":[
+                {
+                    "id":"5c2dc64e03aa675aa263f1a6",
+                    "address":"0x5bedb060b8eb8d823e2414d82acce78d38be7fe9",
+                    "memo":"",
+                    "currency":"ETH",
+                    "amount":1,
+                    "fee":0.01,
+                    "walletTxId":"3e2414d82acce78d38be7fe0",
+                    "isInner":false,
+                    "status":"SUCCESS",
+                    "remark":"movement 6 - withdraw",
+                    "createdAt":1612556794000,
+                    "updatedAt":1612556799000
+                },
+                {
+                    "id":"5c2dc64e03aa675aa263f1a5",
+                    "address":"1DrT5xUaJ3CBZPDeFR2qdjppM6dzs4rsMt",
+                    "memo":"",
+                    "currency":"BCHSV",
+                    "amount":2.5,
+                    "fee":0.25,
+                    "walletTxId":"b893c3ece1b8d7cacb49a39ddd759cf407817f6902f566c443ba16614874ada5",
+                    "isInner":false,
+                    "status":"SUCCESS",
+                    "remark":"movement 5 - withdraw",
+                    "createdAt":1612556765000,
+                    "updatedAt":1612556780000
+                },
+                {
+                    "id":"5c2dc64e03aa675aa263f1a3",
+                    "address":"0x5bedb060b8eb8d823e2414d82acce78d38be7fe9",
+                    "memo":"",
+                    "currency":"ETH",
+                    "amount":1,
+                    "fee":0.01,
+                    "walletTxId":"3e2414d82acce78d38be7fe9",
+                    "isInner":true,
+                    "status":"SUCCESS",
+                    "remark":"movement 3 - withdraw",
+                    "createdAt":1612556765000,
+                    "updatedAt":1612556765000
+                }
+            ]
+        }
+    }
+    """
+)
+# In the order they are requested by query_online_deposits_withdrawals
+ASSET_MOVEMENTS_RESPONSES = (DEPOSITS_RESPONSE, WITHDRAWALS_RESPONSE)
+
 
 def test_name():
     exchange = Kucoin(
@@ -39,26 +182,35 @@ def test_name():
 
 
 def test_kucoin_exchange_assets_are_known(mock_kucoin):
+    """Queries the live kucoin currencies. If kucoin can't be reached the test
+    is xfailed instead of hanging on or failing due to the network.
+    """
     request_url = f'{mock_kucoin.base_uri}/api/v1/currencies'
     try:
-        response = requests.get(request_url)
+        response = mock_kucoin.session.get(request_url, timeout=DEFAULT_TIMEOUT_TUPLE)
     except requests.exceptions.RequestException as e:
-        raise RemoteError(
-            f'Kucoin get request at {request_url} connection error: {str(e)}.',
-        ) from e
+        test_warnings.warn(UserWarning(
+            f'Kucoin get request at {request_url} connection error: {str(e)}. '
+            f'Xfailing this test',
+        ))
+        pytest.xfail('Failed to request kucoin currencies list')
 
     if response.status_code != HTTPStatus.OK:
-        raise RemoteError(
-            f'Kucoin query responded with error status code: {response.status_code} '
-            f'and text: {response.text}',
-        )
+        test_warnings.warn(UserWarning(
+            f'Failed to request kucoin currencies list. '
+            f'Response status code: {response.status_code}. '
+            f'Response text: {response.text}. Xfailing this test',
+        ))
+        pytest.xfail('Failed to request kucoin currencies list')
+
     try:
-        response_dict = rlk_jsonloads_dict(response.text)
+        response_dict = rlk_jsonloads_dict(response.content)
     except JSONDecodeError as e:
         raise RemoteError(f'Kucoin returned invalid JSON response: {response.text}') from e
 
     # Extract the unique symbols from the exchange pairs
     unsupported_assets = set(UNSUPPORTED_KUCOIN_ASSETS)
+    unknown_assets = []
     for entry in response_dict['data']:
         symbol = entry['currency']
         try:
@@ -66,43 +218,32 @@ def test_kucoin_exchange_assets_are_known(mock_kucoin):
         except UnsupportedAsset:
             assert symbol in unsupported_assets
         except UnknownAsset as e:
-            test_warnings.warn(UserWarning(
-                f'Found unknown asset {e.asset_name} in kucoin. '
-                f'Support for it has to be added',
-            ))
+            unknown_assets.append(e.asset_name)
 
+    if len(unknown_assets) != 0:
+        test_warnings.warn(UserWarning(
+            f'Found unknown assets {", ".join(unknown_assets)} in kucoin. '
+            f'Support for them has to be added',
+        ))
 
-def test_api_query_retries_request(mock_kucoin):
 
-    def get_response():
-        results = [
-            """{"code":400007,"msg":"unknown error"}""",
-            """{"code":400007,"msg":"unknown error"}""",
-        ]
-        for result_ in results:
-            yield result_
-
-    def mock_api_query_response(url):  # pylint: disable=unused-argument
-        return MockResponse(HTTPStatus.TOO_MANY_REQUESTS, next(get_response))
-
-    get_response = get_response()
-    api_request_retry_times_patch = patch(
-        target='rotkehlchen.exchanges.kucoin.API_REQUEST_RETRY_TIMES',
-        new=1,
+def test_api_query_retries_request(mock_kucoin):
+    # The response is only read, so the same one is returned for every retry
+    response = MockResponse(
+        HTTPStatus.TOO_MANY_REQUESTS,
+        b'{"code":400007,"msg":"unknown error"}',
     )
-    api_request_retry_after_seconds_patch = patch(
-        target='rotkehlchen.exchanges.kucoin.API_REQUEST_RETRIES_AFTER_SECONDS',
-        new=0,
+    api_request_retries_patch = patch.multiple(
+        target='rotkehlchen.exchanges.kucoin',
+        API_REQUEST_RETRY_TIMES=1,
+        API_REQUEST_RETRIES_AFTER_SECONDS=0,
     )
     api_query_patch = patch.object(
         target=mock_kucoin.session,
         attribute='get',
-        side_effect=mock_api_query_response,
+        side_effect=[response, response],
     )
-    with ExitStack() as stack:
-        stack.enter_context(api_request_retry_times_patch)
-        stack.enter_context(api_request_retry_after_seconds_patch)
-        stack.enter_context(api_query_patch)
+    with api_request_retries_patch, api_query_patch:
         result = mock_kucoin._api_query(
             options={
                 'currentPage': 1,
@@ -208,61 +349,109 @@ def test_deserialize_accounts_balances(mock_kucoin, inquirer):  # pylint: disabl
     ]
     assets_balance = mock_kucoin._deserialize_accounts_balances({'data': accounts_data})
     assert assets_balance == {
-        Asset('BTC'): Balance(
-            amount=FVal('2.61018067'),
-            usd_value=FVal('3.915271005'),
-        ),
-        Asset('ETH'): Balance(
-            amount=FVal('47.43934995'),
-            usd_value=FVal('71.159024925'),
-        ),
-        Asset('KCS'): Balance(
-            amount=FVal('0.2'),
-            usd_value=FVal('0.30'),
-        ),
-        Asset('USDT'): Balance(
-            amount=FVal('45097.26244755'),
-            usd_value=FVal('67645.893671325'),
-        ),
-        Asset('BSV'): Balance(
+        **EXPECTED_SANDBOX_BALANCES,
+        A_BSV: Balance(
             amount=FVal('1'),
             usd_value=FVal('1.5'),
         ),
     }
 
 
-def test_deserialize_trade_buy(mock_kucoin):
-    raw_result = {
-        'symbol': 'KCS-USDT',
-        'tradeId': '601da9faf1297d0007efd712',
-        'orderId': '601da9fa0c92050006bd83be',
-        'counterOrderId': '601bad620c9205000642300f',
-        'side': 'buy',
-        'liquidity': 'taker',
-        'forceTaker': True,
-        'price': 1000,
-        'size': '0.2',
-        'funds': 200,
-        'fee': '0.14',
-        'feeRate': '0.0007',
-        'feeCurrency': 'USDT',
-        'stop': '',
-        'tradeType': 'TRADE',
-        'type': 'market',
-        'createdAt': 1612556794259,
+@pytest.mark.parametrize('should_mock_current_price_queries', [True])
+def test_deserialize_accounts_balances_many_accounts(
+        mock_kucoin,
+        inquirer,  # pylint: disable=unused-argument
+):
+    """Test that the balances of many accounts of the same currencies are summed up"""
+    accounts_data = [
+        {
+            'id': f'{idx}',
+            'currency': currency,
+            'type': 'trade',
+            'balance': '0.001',
+            'available': '0.001',
+            'holds': '0',
+        }
+        for idx in range(500) for currency in ('BTC', 'BCHSV')
+    ]
+    assets_balance = mock_kucoin._deserialize_accounts_balances({'data': accounts_data})
+    assert assets_balance == {
+        A_BTC: Balance(
+            amount=FVal('0.5'),
+            usd_value=FVal('0.75'),
+        ),
+        A_BSV: Balance(
+            amount=FVal('0.5'),
+            usd_value=FVal('0.75'),
+        ),
     }
-    expected_trade = Trade(
-        timestamp=Timestamp(1612556794),
-        location=Location.KUCOIN,
-        pair=TradePair('KCS_USDT'),
-        trade_type=TradeType.BUY,
-        amount=AssetAmount(FVal('0.2')),
-        rate=Price(FVal('1000')),
-        fee=Fee(FVal('0.14')),
-        fee_currency=Asset('USDT'),
-        link='601da9faf1297d0007efd712',
-        notes='',
-    )
+
+
+TRADE_RAW_RESULT = {
+    'symbol': 'KCS-USDT',
+    'tradeId': '601da9faf1297d0007efd712',
+    'orderId': '601da9fa0c92050006bd83be',
+    'counterOrderId': '601bad620c9205000642300f',
+    'side': 'buy',
+    'liquidity': 'taker',
+    'forceTaker': True,
+    'price': 1000,
+    'size': '0.2',
+    'funds': 200,
+    'fee': '0.14',
+    'feeRate': '0.0007',
+    'feeCurrency': 'USDT',
+    'stop': '',
+    'tradeType': 'TRADE',
+    'type': 'market',
+    'createdAt': 1612556794259,
+}
+
+
+@pytest.mark.parametrize('raw_result_overrides, expected_trade', [
+    (
+        {},
+        Trade(
+            timestamp=Timestamp(1612556794),
+            location=Location.KUCOIN,
+            pair=TradePair('KCS_USDT'),
+            trade_type=TradeType.BUY,
+            amount=AssetAmount(FVal('0.2')),
+            rate=Price(FVal('1000')),
+            fee=Fee(FVal('0.14')),
+            fee_currency=A_USDT,
+            link='601da9faf1297d0007efd712',
+            notes='',
+        ),
+    ),
+    (
+        {
+            'symbol': 'BCHSV-USDT',
+            'tradeId': '601da995e0ee8b00063a075c',
+            'orderId': '601da9950c92050006bd45c5',
+            'counterOrderId': '601da9950c92050006bd457d',
+            'side': 'sell',
+            'price': '37624.4',
+            'size': '0.0013',
+            'funds': '48.91172',
+            'fee': '0.034238204',
+        },
+        Trade(
+            timestamp=Timestamp(1612556794),
+            location=Location.KUCOIN,
+            pair=TradePair('BSV_USDT'),
+            trade_type=TradeType.SELL,
+            amount=AssetAmount(FVal('0.0013')),
+            rate=Price(FVal('37624.4')),
+            fee=Fee(FVal('0.034238204')),
+            fee_currency=A_USDT,
+            link='601da995e0ee8b00063a075c',
+            notes='',
+        ),
+    ),
+])
+def test_deserialize_trade(mock_kucoin, raw_result_overrides, expected_trade):
+    raw_result = {**TRADE_RAW_RESULT, **raw_result_overrides}
     trade, reason = mock_kucoin._deserialize_trade(
         raw_result=raw_result,
         start_ts=Timestamp(0),
@@ -272,45 +461,25 @@ def test_deserialize_trade_buy(mock_kucoin):
     assert reason is None
 
 
-def test_deserialize_trade_sell(mock_kucoin):
-    raw_result = {
-        'symbol': 'BCHSV-USDT',
-        'tradeId': '601da995e0ee8b00063a075c',
-        'orderId': '601da9950c92050006bd45c5',
-        'counterOrderId': '601da9950c92050006bd457d',
-        'side': 'sell',
-        'liquidity': 'taker',
-        'forceTaker': True,
-        'price': '37624.4',
-        'size': '0.0013',
-        'funds': '48.91172',
-        'fee': '0.034238204',
-        'feeRate': '0.0007',
-        'feeCurrency': 'USDT',
-        'stop': '',
-        'tradeType': 'TRADE',
-        'type': 'market',
-        'createdAt': 1612556794259,
-    }
-    expected_trade = Trade(
-        timestamp=Timestamp(1612556794),
-        location=Location.KUCOIN,
-        pair=TradePair('BSV_USDT'),
-        trade_type=TradeType.SELL,
-        amount=AssetAmount(FVal('0.0013')),
-        rate=Price(FVal('37624.4')),
-        fee=Fee(FVal('0.034238204')),
-        fee_currency=Asset('USDT'),
-        link='601da995e0ee8b00063a075c',
-        notes='',
-    )
-    trade, reason = mock_kucoin._deserialize_trade(
-        raw_result=raw_result,
-        start_ts=Timestamp(0),
-        end_ts=Timestamp(1612556794),
+@pytest.mark.skipif(
+    'CI' in os.environ,
+    reason='Timings depend on the machine. This test is only for us to catch slowdowns',
+)
+def test_deserialize_trade_speed(mock_kucoin):
+    """Test that deserializing a trade, which happens for every queried trade,
+    does not get considerably slower"""
+    number = 200
+    timings = timeit.repeat(
+        lambda: mock_kucoin._deserialize_trade(
+            raw_result=TRADE_RAW_RESULT,
+            start_ts=Timestamp(0),
+            end_ts=Timestamp(2 ** 31),
+        ),
+        repeat=5,
+        number=number,
     )
-    assert trade == expected_trade
-    assert reason is None
+    # Take the best run to leave out noise from other processes
+    assert min(timings) / number < 1e-3
 
 
 @pytest.mark.parametrize('start_ts, end_ts, skip_reason', [
@@ -318,27 +487,8 @@ def test_deserialize_trade_sell(mock_kucoin):
     (1612556795, 1612556800, SkipReason.BEFORE_TIMESTAMP_RANGE),
 ])
 def test_deserialize_trade_skipped(mock_kucoin, start_ts, end_ts, skip_reason):
-    raw_result = {
-        'symbol': 'KCS-USDT',
-        'tradeId': '601da9faf1297d0007efd712',
-        'orderId': '601da9fa0c92050006bd83be',
-        'counterOrderId': '601bad620c9205000642300f',
-        'side': 'buy',
-        'liquidity': 'taker',
-        'forceTaker': True,
-        'price': 1000,
-        'size': '0.2',
-        'funds': 200,
-        'fee': '0.14',
-        'feeRate': '0.0007',
-        'feeCurrency': 'USDT',
-        'stop': '',
-        'tradeType': 'TRADE',
-        'type': 'market',
-        'createdAt': 1612556794259,
-    }
     trade, reason = mock_kucoin._deserialize_trade(
-        raw_result=raw_result,
+        raw_result=TRADE_RAW_RESULT,
         start_ts=Timestamp(start_ts),
         end_ts=Timestamp(end_ts),
     )
@@ -346,72 +496,66 @@ def test_deserialize_trade_skipped(mock_kucoin, start_ts, end_ts, skip_reason):
     assert reason == skip_reason
 
 
-def test_deserialize_asset_movement_deposit(mock_kucoin):
-    raw_result = {
-        'address': '0x5bedb060b8eb8d823e2414d82acce78d38be7fe9',
-        'memo': '',
-        'currency': 'ETH',
-        'amount': 1,
-        'fee': 0.01,
-        'walletTxId': '3e2414d82acce78d38be7fe9',
-        'isInner': False,
-        'status': 'SUCCESS',
-        'remark': 'test',
-        'createdAt': 1612556794259,
-        'updatedAt': 1612556795000,
-    }
-    expected_asset_movement = AssetMovement(
-        timestamp=Timestamp(1612556794),
-        location=Location.KUCOIN,
-        category=AssetMovementCategory.DEPOSIT,
-        address='0x5bedb060b8eb8d823e2414d82acce78d38be7fe9',
-        transaction_id='3e2414d82acce78d38be7fe9',
-        asset=Asset('ETH'),
-        amount=AssetAmount(FVal('1')),
-        fee_asset=Asset('ETH'),
-        fee=Fee(FVal('0.01')),
-        link='',
-    )
-    asset_movement, reason = mock_kucoin._deserialize_asset_movement(
-        raw_result=raw_result,
-        case=KucoinCase.DEPOSITS,
-        start_ts=Timestamp(0),
-        end_ts=Timestamp(1612556794),
-    )
-    assert asset_movement == expected_asset_movement
-    assert reason is None
-
-
-def test_deserialize_asset_movement_withdrawal(mock_kucoin):
-    raw_result = {
-        'id': '5c2dc64e03aa675aa263f1ac',
-        'address': '0x5bedb060b8eb8d823e2414d82acce78d38be7fe9',
-        'memo': '',
-        'currency': 'ETH',
-        'amount': 1,
-        'fee': 0.01,
-        'walletTxId': '3e2414d82acce78d38be7fe9',
-        'isInner': False,
-        'status': 'SUCCESS',
-        'remark': 'test',
-        'createdAt': 1612556794259,
-        'updatedAt': 1612556795000,
-    }
-    expected_asset_movement = AssetMovement(
-        timestamp=Timestamp(1612556794),
-        location=Location.KUCOIN,
-        category=AssetMovementCategory.WITHDRAWAL,
-        address='0x5bedb060b8eb8d823e2414d82acce78d38be7fe9',
-        transaction_id='3e2414d82acce78d38be7fe9',
-        asset=Asset('ETH'),
-        amount=AssetAmount(FVal('1')),
-        fee_asset=Asset('ETH'),
-        fee=Fee(FVal('0.01')),
-        link='5c2dc64e03aa675aa263f1ac',
-    )
+ASSET_MOVEMENT_RAW_RESULT = {
+    'address': '0x5bedb060b8eb8d823e2414d82acce78d38be7fe9',
+    'memo': '',
+    'currency': 'ETH',
+    'amount': 1,
+    'fee': 0.01,
+    'walletTxId': '3e2414d82acce78d38be7fe9',
+    'isInner': False,
+    'status': 'SUCCESS',
+    'remark': 'test',
+    'createdAt': 1612556794259,
+    'updatedAt': 1612556795000,
+}
+
+
+@pytest.mark.parametrize('raw_result_overrides, case, expected_asset_movement', [
+    (
+        {},
+        KucoinCase.DEPOSITS,
+        AssetMovement(
+            timestamp=Timestamp(1612556794),
+            location=Location.KUCOIN,
+            category=AssetMovementCategory.DEPOSIT,
+            address='0x5bedb060b8eb8d823e2414d82acce78d38be7fe9',
+            transaction_id='3e2414d82acce78d38be7fe9',
+            asset=A_ETH,
+            amount=AssetAmount(FVal('1')),
+            fee_asset=A_ETH,
+            fee=Fee(FVal('0.01')),
+            link='',
+        ),
+    ),
+    (
+        # NB: id only exists for withdrawals
+        {'id': '5c2dc64e03aa675aa263f1ac'},
+        KucoinCase.WITHDRAWALS,
+        AssetMovement(
+            timestamp=Timestamp(1612556794),
+            location=Location.KUCOIN,
+            category=AssetMovementCategory.WITHDRAWAL,
+            address='0x5bedb060b8eb8d823e2414d82acce78d38be7fe9',
+            transaction_id='3e2414d82acce78d38be7fe9',
+            asset=A_ETH,
+            amount=AssetAmount(FVal('1')),
+            fee_asset=A_ETH,
+            fee=Fee(FVal('0.01')),
+            link='5c2dc64e03aa675aa263f1ac',
+        ),
+    ),
+])
+def test_deserialize_asset_movement(
+        mock_kucoin,
+        raw_result_overrides,
+        case,
+        expected_asset_movement,
+):
+    raw_result = {**ASSET_MOVEMENT_RAW_RESULT, **raw_result_overrides}
     asset_movement, reason = mock_kucoin._deserialize_asset_movement(
         raw_result=raw_result,
-        case=KucoinCase.WITHDRAWALS,
+        case=case,
         start_ts=Timestamp(0),
         end_ts=Timestamp(1612556794),
     )
@@ -425,20 +569,9 @@ def test_deserialize_asset_movement_withdrawal(mock_kucoin):
     (1612556750, 1612556800, True, SkipReason.INNER_MOVEMENT),
 ])
 def test_deserialize_asset_movement_skipped(mock_kucoin, start_ts, end_ts, is_inner, skip_reason):
-    raw_result = {
-        'id': '5c2dc64e03aa675aa263f1ac',
-        'address': '0x5bedb060b8eb8d823e2414d82acce78d38be7fe9',
-        'memo': '',
-        'currency': 'ETH',
-        'amount': 1,
-        'fee': 0.01,
-        'walletTxId': '3e2414d82acce78d38be7fe9',
-        'isInner': is_inner,
-        'status': 'SUCCESS',
-        'remark': 'test',
-        'createdAt': 1612556794259,
-        'updatedAt': 1612556795000,
-    }
+    raw_result = ASSET_MOVEMENT_RAW_RESULT
+    if is_inner is True:
+        raw_result = {**ASSET_MOVEMENT_RAW_RESULT, 'isInner': True}
     asset_movement, reason = mock_kucoin._deserialize_asset_movement(
         raw_result=raw_result,
         case=KucoinCase.WITHDRAWALS,
@@ -452,24 +585,7 @@ def test_deserialize_asset_movement_skipped(mock_kucoin, start_ts, end_ts, is_in
 @pytest.mark.parametrize('should_mock_current_price_queries', [True])
 def test_query_balances_sandbox(sandbox_kuckoin, inquirer):  # pylint: disable=unused-argument
     assets_balance, msg = sandbox_kuckoin.query_balances()
-    assert assets_balance == {
-        Asset('BTC'): Balance(
-            amount=FVal('2.61018067'),
-            usd_value=FVal('3.915271005'),
-        ),
-        Asset('ETH'): Balance(
-            amount=FVal('47.43934995'),
-            usd_value=FVal('71.159024925'),
-        ),
-        Asset('KCS'): Balance(
-            amount=FVal('0.2'),
-            usd_value=FVal('0.30'),
-        ),
-        Asset('USDT'): Balance(
-            amount=FVal('45097.26244755'),
-            usd_value=FVal('67645.893671325'),
-        ),
-    }
+    assert assets_balance == EXPECTED_SANDBOX_BALANCES
     assert msg == ''
 
 
@@ -487,59 +603,31 @@ def test_query_trades_sandbox(sandbox_kuckoin, inquirer):  # pylint: disable=unu
     By requesting trades from 1612556693 to 1612556765, the first and last trade
     should be skipped.
     """
+    # timestamp, pair, trade type, amount, rate, fee, fee currency, link
+    trades_data = [
+        (SANDBOX_END_TS, 'ETH_BTC', TradeType.BUY, '0.02934995', '0.046058', '9.4625999797E-7', A_BTC, '601da9ddf73c300006194ec6'),  # noqa: E501
+        (SANDBOX_END_TS, 'ETH_BTC', TradeType.BUY, '0.02', '0.04561', '6.3854E-7', A_BTC, '601da9ddf73c300006194ec5'),  # noqa: E501
+        (SANDBOX_END_TS, 'ETH_BTC', TradeType.BUY, '0.06', '0.0456', '0.0000019152', A_BTC, '601da9ddf73c300006194ec4'),  # noqa: E501
+        (SANDBOX_START_TS, 'BTC_USDT', TradeType.SELL, '0.0013', '37624.4', '0.034238204', A_USDT, '601da995e0ee8b00063a075c'),  # noqa: E501
+    ]
     expected_trades = [
         Trade(
-            timestamp=Timestamp(1612556765),
-            location=Location.KUCOIN,
-            pair=TradePair('ETH_BTC'),
-            trade_type=TradeType.BUY,
-            amount=AssetAmount(FVal('0.02934995')),
-            rate=Price(FVal('0.046058')),
-            fee=Fee(FVal('9.4625999797E-7')),
-            fee_currency=Asset('BTC'),
-            link='601da9ddf73c300006194ec6',
-            notes='',
-        ),
-        Trade(
-            timestamp=Timestamp(1612556765),
-            location=Location.KUCOIN,
-            pair=TradePair('ETH_BTC'),
-            trade_type=TradeType.BUY,
-            amount=AssetAmount(FVal('0.02')),
-            rate=Price(FVal('0.04561')),
-            fee=Fee(FVal('6.3854E-7')),
-            fee_currency=Asset('BTC'),
-            link='601da9ddf73c300006194ec5',
-            notes='',
-        ),
-        Trade(
-            timestamp=Timestamp(1612556765),
-            location=Location.KUCOIN,
-            pair=TradePair('ETH_BTC'),
-            trade_type=TradeType.BUY,
-            amount=AssetAmount(FVal('0.06')),
-            rate=Price(FVal('0.0456')),
-            fee=Fee(FVal('0.0000019152')),
-            fee_currency=Asset('BTC'),
-            link='601da9ddf73c300006194ec4',
-            notes='',
-        ),
-        Trade(
-            timestamp=Timestamp(1612556693),
+            timestamp=timestamp,
             location=Location.KUCOIN,
-            pair=TradePair('BTC_USDT'),
-            trade_type=TradeType.SELL,
-            amount=AssetAmount(FVal('0.0013')),
-            rate=Price(FVal('37624.4')),
-            fee=Fee(FVal('0.034238204')),
-            fee_currency=Asset('USDT'),
-            link='601da995e0ee8b00063a075c',
+            pair=TradePair(pair),
+            trade_type=trade_type,
+            amount=AssetAmount(FVal(amount)),
+            rate=Price(FVal(rate)),
+            fee=Fee(FVal(fee)),
+            fee_currency=fee_currency,
+            link=link,
             notes='',
-        ),
+        )
+        for timestamp, pair, trade_type, amount, rate, fee, fee_currency, link in trades_data
     ]
     trades = sandbox_kuckoin.query_online_trade_history(
-        start_ts=Timestamp(1612556693),
-        end_ts=Timestamp(1612556765),
+        start_ts=SANDBOX_START_TS,
+        end_ts=SANDBOX_END_TS,
     )
     assert trades == expected_trades
 
@@ -564,164 +652,41 @@ def test_query_asset_movements_sandbox(
     By requesting trades from 1612556693 to 1612556765, the first and last
     movement should be skipped, but also the two inner movements.
     """
-    deposits_response = (
-        """
-        {
-            "code":"200000",
-            "data":{
-                "currentPage":1,
-                "pageSize":500,
-                "totalNum":3,
-                "totalPage":1,
-                "items":[
-                    {
-                        "address":"1DrT5xUaJ3CBZPDeFR2qdjppM6dzs4rsMt",
-                        "memo":"",
-                        "currency":"BCHSV",
-                        "amount":1,
-                        "fee":0.1,
-                        "walletTxId":"b893c3ece1b8d7cacb49a39ddd759cf407817f6902f566c443ba16614874ada6",
-                        "isInner":true,
-                        "status":"SUCCESS",
-                        "remark":"movement 4 - deposit",
-                        "createdAt":1612556765000,
-                        "updatedAt":1612556780000
-                    },
-                    {
-                        "address":"0x5f047b29041bcfdbf0e4478cdfa753a336ba6989",
-                        "memo":"5c247c8a03aa677cea2a251d",
-                        "amount":1,
-                        "fee":0.0001,
-                        "currency":"KCS",
-                        "isInner":false,
-                        "walletTxId":"5bbb57386d99522d9f954c5a",
-                        "status":"SUCCESS",
-                        "remark":"movement 2 - deposit",
-                        "createdAt":1612556693000,
-                        "updatedAt":1612556700000
-                    },
-                    {
-                        "address":"0x5f047b29041bcfdbf0e4478cdfa753a336ba6989",
-                        "memo":"5c247c8a03aa677cea2a251d",
-                        "amount":1000,
-                        "fee":0.01,
-                        "currency":"LINK",
-                        "isInner":false,
-                        "walletTxId":"5bbb57386d99522d9f954c5b",
-                        "status":"SUCCESS",
-                        "remark":"movement 1 - deposit",
-                        "createdAt":1612556651000,
-                        "updatedAt":1612556658000
-                    }
-                ]
-            }
-        }
-        """
-    )
-    withdrawals_response = (
-        """
-        {
-            "code":"200000",
-            "data":{
-                "currentPage":1,
-                "pageSize":500,
-                "totalNum":3,
-                "totalPage":1,
-                "items":[
-                    {
-                        "id":"5c2dc64e03aa675aa263f1a6",
-                        "address":"0x5bedb060b8eb8d823e2414d82acce78d38be7fe9",
-                        "memo":"",
-                        "currency":"ETH",
-                        "amount":1,
-                        "fee":0.01,
-                        "walletTxId":"3e2414d82acce78d38be7fe0",
-                        "isInner":false,
-                        "status":"SUCCESS",
-                        "remark":"movement 6 - withdraw",
-                        "createdAt":1612556794000,
-                        "updatedAt":1612556799000
-                    },
-                    {
-                        "id":"5c2dc64e03aa675aa263f1a5",
-                        "address":"1DrT5xUaJ3CBZPDeFR2qdjppM6dzs4rsMt",
-                        "memo":"",
-                        "currency":"BCHSV",
-                        "amount":2.5,
-                        "fee":0.25,
-                        "walletTxId":"b893c3ece1b8d7cacb49a39ddd759cf407817f6902f566c443ba16614874ada5",
-                        "isInner":false,
-                        "status":"SUCCESS",
-                        "remark":"movement 5 - withdraw",
-                        "createdAt":1612556765000,
-                        "updatedAt":1612556780000
-                    },
-                    {
-                        "id":"5c2dc64e03aa675aa263f1a3",
-                        "address":"0x5bedb060b8eb8d823e2414d82acce78d38be7fe9",
-                        "memo":"",
-                        "currency":"ETH",
-                        "amount":1,
-                        "fee":0.01,
-                        "walletTxId":"3e2414d82acce78d38be7fe9",
-                        "isInner":true,
-                        "status":"SUCCESS",
-                        "remark":"movement 3 - withdraw",
-                        "createdAt":1612556765000,
-                        "updatedAt":1612556765000
-                    }
-                ]
-            }
-        }
-        """
-    )
     expected_asset_movements = [
         AssetMovement(
             location=Location.KUCOIN,
             category=AssetMovementCategory.DEPOSIT,
-            timestamp=Timestamp(1612556693),
+            timestamp=SANDBOX_START_TS,
             address='0x5f047b29041bcfdbf0e4478cdfa753a336ba6989',
             transaction_id='5bbb57386d99522d9f954c5a',
-            asset=Asset('KCS'),
+            asset=A_KCS,
             amount=AssetAmount(FVal('1')),
-            fee_asset=Asset('KCS'),
+            fee_asset=A_KCS,
             fee=Fee(FVal('0.0001')),
             link='',
         ),
         AssetMovement(
             location=Location.KUCOIN,
             category=AssetMovementCategory.WITHDRAWAL,
-            timestamp=Timestamp(1612556765),
+            timestamp=SANDBOX_END_TS,
             address='1DrT5xUaJ3CBZPDeFR2qdjppM6dzs4rsMt',
             transaction_id='b893c3ece1b8d7cacb49a39ddd759cf407817f6902f566c443ba16614874ada5',
-            asset=Asset('BSV'),
+            asset=A_BSV,
             amount=AssetAmount(FVal('2.5')),
-            fee_asset=Asset('BSV'),
+            fee_asset=A_BSV,
             fee=Fee(FVal('0.25')),
             link='5c2dc64e03aa675aa263f1a5',
         ),
     ]
 
-    def get_endpoints_response():
-        results = [
-            f'{deposits_response}',
-            f'{withdrawals_response}',
-        ]
-        for result_ in results:
-            yield result_
-
-    def mock_api_query_response(case, options):  # pylint: disable=unused-argument
-        return MockResponse(HTTPStatus.OK, next(get_response))
-
-    get_response = get_endpoints_response()
     with patch.object(
         target=sandbox_kuckoin,
         attribute='_api_query',
-        side_effect=mock_api_query_response,
+        side_effect=[MockResponse(HTTPStatus.OK, x) for x in ASSET_MOVEMENTS_RESPONSES],
     ):
         asset_movements = sandbox_kuckoin.query_online_deposits_withdrawals(
-            start_ts=Timestamp(1612556693),
-            end_ts=Timestamp(1612556765),
+            start_ts=SANDBOX_START_TS,
+            end_ts=SANDBOX_END_TS,
         )
 
     assert asset_movements == expected_asset_movements
@@ -42,25 +42,25 @@ def mock_kucoin(
     )
 
 
-@pytest.fixture(name='kucoin_sandbox_api_key')
+@pytest.fixture(scope='session', name='kucoin_sandbox_api_key')
 def fixture_kucoin_sandbox_api_key():
     # General permission (aka read-only)
     return '6023e471a2644e00063aa8bb'
 
 
-@pytest.fixture(name='kucoin_sandbox_api_secret')
+@pytest.fixture(scope='session', name='kucoin_sandbox_api_secret')
 def fixture_kucoin_sandbox_api_secret():
     # General permission (aka read-only)
     return b'3a817593-eceb-47f3-90d4-26de79de588a'
 
 
-@pytest.fixture(name='kucoin_sandbox_passphrase')
+@pytest.fixture(scope='session', name='kucoin_sandbox_passphrase')
 def fixture_kucoin_sandbox_passphrase():
     # General permission (aka read-only)
     return 'rotkidev'
 
 
-@pytest.fixture(name='kucoin_sandbox_base_uri')
+@pytest.fixture(scope='session', name='kucoin_sandbox_base_uri')
 def fixture_kucoin_sandbox_base_uri():
     return 'https://openapi-sandbox.kucoin.com'
 
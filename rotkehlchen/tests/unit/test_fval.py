@@ -160,6 +160,13 @@ def test_conversion():
         b.to_int(exact=True)
 
 
+def test_initialize_with_fval():
+    a = FVal('2.0123')
+    b = FVal(a)
+    assert b == a
+    assert b.num is a.num
+
+
 def test_to_percentage():
     assert FVal('0.5').to_percentage() == '50.0000%'
     assert FVal('0.2345').to_percentage() == '23.4500%'
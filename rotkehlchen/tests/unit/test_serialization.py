@@ -1,3 +1,5 @@
+from json.decoder import JSONDecodeError
+
 import pytest
 
 from rotkehlchen.balances.manual import ManuallyTrackedBalance, add_manually_tracked_balances
@@ -15,6 +17,7 @@ from rotkehlchen.utils.serialization import (
     rkl_decode_value,
     rlk_jsondumps,
     rlk_jsonloads,
+    rlk_jsonloads_dict,
 )
 
 
@@ -40,6 +43,24 @@ def test_rlk_jsonloads():
     }
 
 
+def test_rlk_jsonloads_dict():
+    data = '{"a": "5.4", "b": "foo", "c": 32.1, "d": 5, "e": [1, "a", "5.1"], "f": {"symbol": "1337"}}'  # noqa: E501
+    expected = {
+        'a': FVal('5.4'),
+        'b': 'foo',
+        'c': FVal('32.1'),
+        'd': 5,
+        'e': [1, 'a', FVal('5.1')],
+        'f': {'symbol': '1337'},
+    }
+    assert rlk_jsonloads_dict(data) == expected
+    assert rlk_jsonloads_dict(data.encode()) == expected
+    # Integers bigger than 64 bits must not lose precision
+    assert rlk_jsonloads_dict(b'{"a": 37451082560000003241}') == {'a': 37451082560000003241}
+    with pytest.raises(JSONDecodeError):
+        rlk_jsonloads_dict(b'{"a": 5')
+
+
 TEST_DATA = {
     'a': FVal('5.4'),
     'b': 'foo',
@@ -11,6 +11,7 @@ A_MKR = EthereumToken('MKR')
 A_BAT = EthereumToken('BAT')
 A_WBTC = EthereumToken('WBTC')
 A_USDC = EthereumToken('USDC')
+A_KCS = EthereumToken('KCS')
 A_ADAI = Asset('aDAI')
 A_CDAI = Asset('cDAI')
 A_CUSDC = Asset('cUSDC')
@@ -1,6 +1,6 @@
 import json
 from collections import namedtuple
-from typing import Any, Dict
+from typing import Any, Dict, Union
 
 from hexbytes import HexBytes
 
@@ -9,12 +9,16 @@ class MockResponse():
     def __init__(
             self,
             status_code: int,
-            text: str,
+            text: Union[str, bytes],
             headers: Dict['str', Any] = None,
     ) -> None:
         self.status_code = status_code
-        self.text = text
-        self.content = text.encode()
+        if isinstance(text, bytes):
+            self.text = text.decode()
+            self.content = text
+        else:
+            self.text = text
+            self.content = text.encode()
         self.url = 'http://someurl.com'
         self.headers = headers or {}
 
@@ -1,13 +1,23 @@
 import json
+import re
 from typing import Any, Dict, List, Union
 
 from rotkehlchen.assets.asset import Asset
 from rotkehlchen.fval import FVal
 from rotkehlchen.typing import Location, TradeType
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 DecodableValue = Union[Dict, List, float, bytes, str, int, FVal]
 DecodedValue = Union[Dict, FVal, List, bytes, str, int]
 
+# Digit runs that may be integers not fitting in 64 bits
+_LONG_DIGITS_STR_RE = re.compile(r'[0-9]{19,}')
+_LONG_DIGITS_BYTES_RE = re.compile(rb'[0-9]{19,}')
+
 
 class RKLDecoder(json.JSONDecoder):
     def __init__(self, *args: Any, **kwargs: Any) -> None:
@@ -47,8 +57,31 @@ def rlk_jsonloads(data: str) -> Union[Dict, List]:
     return json.loads(data, cls=RKLDecoder)
 
 
-def rlk_jsonloads_dict(data: str) -> Dict[str, Any]:
-    value = rlk_jsonloads(data)
+def rlk_jsonloads_dict(data: Union[str, bytes]) -> Dict[str, Any]:
+    """Loads a JSON object and decodes its values like `RKLDecoder` does
+
+    If available orjson is used to parse the data since it's considerably faster
+    than the stdlib json module, especially when given bytes. orjson parses
+    integers bigger than 64 bits as floats, so data that may contain them goes
+    through the stdlib json module instead, as does anything orjson can't parse.
+    """
+    value: Union[Dict, List]
+    if isinstance(data, bytes):
+        has_long_digits = _LONG_DIGITS_BYTES_RE.search(data) is not None
+    else:
+        has_long_digits = _LONG_DIGITS_STR_RE.search(data) is not None
+
+    if orjson is not None and has_long_digits is False:
+        try:
+            value = orjson.loads(data)
+        except orjson.JSONDecodeError:
+            value = rlk_jsonloads(data)  # type: ignore  # json.loads also accepts bytes
+        else:
+            if isinstance(value, dict):
+                value = rkl_decode_value(value)  # type: ignore  # a dict decodes to a dict
+    else:
+        value = rlk_jsonloads(data)  # type: ignore  # json.loads also accepts bytes
+
     assert isinstance(value, dict)
     return value
 